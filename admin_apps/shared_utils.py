@@ -3,14 +3,16 @@ from __future__ import annotations
 import json
 import os
 import time
+import uuid
 from dataclasses import dataclass
-from datetime import datetime
 from enum import Enum
-from io import StringIO
-from typing import Any, Optional
+from functools import lru_cache
+from io import BytesIO
+from typing import TYPE_CHECKING, Any, Iterable, Optional
 
 import pandas as pd
 import streamlit as st
+from google.protobuf.message import Message
 from PIL import Image
 from snowflake.connector import SnowflakeConnection
 
@@ -18,10 +20,6 @@ from semantic_model_generator.data_processing.proto_utils import (
     proto_to_yaml,
     yaml_to_semantic_model,
 )
-from semantic_model_generator.generate_model import (
-    generate_model_str_from_snowflake,
-    raw_schema_to_semantic_context,
-)
 from semantic_model_generator.protos import semantic_model_pb2
 from semantic_model_generator.protos.semantic_model_pb2 import Dimension, Table
 from semantic_model_generator.snowflake_utils.snowflake_connector import (
@@ -34,8 +32,23 @@ from semantic_model_generator.snowflake_utils.snowflake_connector import (
     set_schema,
 )
 
+if TYPE_CHECKING:
+    from google.protobuf.internal.containers import RepeatedScalarFieldContainer
+
 SNOWFLAKE_ACCOUNT = os.environ.get("SNOWFLAKE_ACCOUNT_LOCATOR", "")
-_TMP_FILE_NAME = f"admin_app_temp_model_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+
+# Options for the default aggregation selectbox, computed once rather than on every dialog render.
+# Replace the 'aggregation_type_unknown' string with an empty string for a better display of options.
+_AGGR_OPTIONS = [""] + list(semantic_model_pb2.AggregationType.keys())[1:]
+_AGGR_VALUE_TO_IDX = {
+    value: idx for idx, value in enumerate(semantic_model_pb2.AggregationType.values())
+}
+
+# Relative widths of the name/expression/data type columns and the Edit/Delete buttons for each row in display_table.
+_FIELD_ROW_COLUMN_SPEC = [2, 2, 2, 1, 1]
+
+# Maximum number of data_editor initial DataFrames kept in the session state by values_data_editor.
+_MAX_CACHED_DATA_EDITORS = 64
 
 # Add a logo on the top-left corner of the app
 LOGO_URL_LARGE = "https://upload.wikimedia.org/wikipedia/commons/thumb/f/ff/Snowflake_Logo.svg/2560px-Snowflake_Logo.svg.png"
@@ -135,27 +148,34 @@ def return_home_button() -> None:
         st.rerun()
 
 
+def _serialize_without_verified_queries(
+    semantic_model: semantic_model_pb2.SemanticModel,
+) -> bytes:
+    """Deterministically serializes a copy of the semantic model, except for verified_queries field.
+    The input model is left untouched."""
+    semantic_model_copy = semantic_model_pb2.SemanticModel()
+    semantic_model_copy.CopyFrom(semantic_model)
+    semantic_model_copy.ClearField("verified_queries")
+    return semantic_model_copy.SerializeToString(deterministic=True)
+
+
 def update_last_validated_model() -> None:
-    """Whenever user validated, update the last_validated_model to track semantic_model,
+    """Whenever user validated, update the last_validated_model_bytes to track semantic_model,
     except for verified_queries field."""
-    st.session_state.last_validated_model.CopyFrom(st.session_state.semantic_model)
     # Do not save verfieid_queries field for the latest validated.
-    del st.session_state.last_validated_model.verified_queries[:]
+    # Only the serialized form is kept, since comparisons just need to serialize the current model.
+    st.session_state.last_validated_model_bytes = _serialize_without_verified_queries(
+        st.session_state.semantic_model
+    )
 
 
 def changed_from_last_validated_model() -> bool:
     """Compare the last validated model against latest semantic model,
     except for verified_queries field."""
-
-    for field in st.session_state.semantic_model.DESCRIPTOR.fields:
-        if field.name != "verified_queries":
-            model_value = getattr(st.session_state.semantic_model, field.name)
-            last_validated_value = getattr(
-                st.session_state.last_validated_model, field.name
-            )
-            if model_value != last_validated_value:
-                return True
-    return False
+    return (
+        _serialize_without_verified_queries(st.session_state.semantic_model)
+        != st.session_state.last_validated_model_bytes
+    )
 
 
 def init_session_states() -> None:
@@ -165,9 +185,10 @@ def init_session_states() -> None:
     # validated stores the status if the generated yaml has ever been validated.
     if "validated" not in st.session_state:
         st.session_state.validated = None
-    # last_validated_model stores the proto (without verfied queries) from last successful validation.
-    if "last_validated_model" not in st.session_state:
-        st.session_state.last_validated_model = semantic_model_pb2.SemanticModel()
+    # last_validated_model_bytes stores the serialized proto (without verfied queries) from last successful validation.
+    # Before any validation, it is the serialization of an empty model.
+    if "last_validated_model_bytes" not in st.session_state:
+        st.session_state.last_validated_model_bytes = b""
 
     # Chat display settings.
     if "chat_debug" not in st.session_state:
@@ -189,6 +210,61 @@ def init_session_states() -> None:
         st.session_state.confirmed_edits = False
 
 
+def values_data_editor(
+    values: Iterable[str], column: str, key: str, **kwargs: Any
+) -> pd.DataFrame:
+    """
+    Renders a dynamic data_editor over a list of string values, e.g. synonyms or sample values.
+    The DataFrame passed as the editor's initial data is kept in the session state and only rebuilt when the
+    values change, instead of on every rerun. Note that st.session_state[key] itself holds the editor's pending
+    edits rather than a DataFrame, so the initial data is stored separately, in a dict bounded to the most
+    recently rendered editors.
+    """
+    current_values = tuple(values)
+    initial_data = st.session_state.setdefault("data_editor_initial_data", {})
+    # Pop and re-insert the entry so the dict stays ordered from least to most recently rendered.
+    cached_values, initial_df = initial_data.pop(key, (None, None))
+    if cached_values != current_values:
+        initial_df = pd.DataFrame(list(current_values), columns=[column])
+    initial_data[key] = (current_values, initial_df)
+    while len(initial_data) > _MAX_CACHED_DATA_EDITORS:
+        del initial_data[next(iter(initial_data))]
+
+    edited_df: pd.DataFrame = st.data_editor(
+        initial_df, num_rows="dynamic", key=key, **kwargs
+    )
+    return edited_df
+
+
+def data_editor_values(df: pd.DataFrame, column: str) -> list[str]:
+    """
+    Returns the non-empty values of a single column from a data_editor DataFrame.
+    """
+    values = df[column]
+    return values[values.astype(bool)].tolist()  # type: ignore[no-any-return]
+
+
+def replace_repeated_values(
+    field: RepeatedScalarFieldContainer[str], values: list[str]
+) -> None:
+    """
+    Replaces the contents of a repeated string field in a protobuf with the given values.
+    Values are written with a single bulk extend rather than appended one at a time.
+    """
+    if field == values:
+        return
+    del field[:]
+    field.extend(values)
+
+
+def set_if_changed(message: Message, field_name: str, value: Any) -> None:
+    """
+    Sets a singular field on a protobuf message, skipping the write when the value is unchanged.
+    """
+    if getattr(message, field_name) != value:
+        setattr(message, field_name, value)
+
+
 @st.dialog("Edit Dimension")  # type: ignore[misc]
 def edit_dimension(table_name: str, dim: semantic_model_pb2.Dimension) -> None:
     """
@@ -203,16 +279,13 @@ def edit_dimension(table_name: str, dim: semantic_model_pb2.Dimension) -> None:
         "Description", dim.description, key=f"{key_prefix}-edit-dim-description"
     )
     # Allow users to edit synonyms through a data_editor.
-    synonyms_df = st.data_editor(
-        pd.DataFrame(list(dim.synonyms), columns=["Synonyms"]),
-        num_rows="dynamic",
+    synonyms_df = values_data_editor(
+        dim.synonyms,
+        "Synonyms",
         key=f"{key_prefix}-edit-dim-synonyms",
     )
     # Store the current values in data_editor in the protobuf.
-    del dim.synonyms[:]
-    for _, row in synonyms_df.iterrows():
-        if row["Synonyms"]:
-            dim.synonyms.append(row["Synonyms"])
+    replace_repeated_values(dim.synonyms, data_editor_values(synonyms_df, "Synonyms"))
 
     # TODO(nsehrawat): Change to a select box with a list of all data types.
     dim.data_type = st.text_input(
@@ -224,16 +297,15 @@ def edit_dimension(table_name: str, dim: semantic_model_pb2.Dimension) -> None:
         key=f"{key_prefix}-edit-dim-unique",
     )
     # Allow users to edit sample values through a data_editor.
-    sample_values_df = st.data_editor(
-        pd.DataFrame(list(dim.sample_values), columns=["Sample Values"]),
-        num_rows="dynamic",
+    sample_values_df = values_data_editor(
+        dim.sample_values,
+        "Sample Values",
         key=f"{key_prefix}-edit-dim-sample-values",
     )
     # Store the current values in data_editor in the protobuf.
-    del dim.sample_values[:]
-    for _, row in sample_values_df.iterrows():
-        if row["Sample Values"]:
-            dim.sample_values.append(row["Sample Values"])
+    replace_repeated_values(
+        dim.sample_values, data_editor_values(sample_values_df, "Sample Values")
+    )
 
     if st.button("Save"):
         st.rerun()
@@ -250,28 +322,23 @@ def add_dimension(table: semantic_model_pb2.Table) -> None:
     dim.description = st.text_area(
         "Description", key=f"{table.name}-add-dim-description"
     )
-    synonyms_df = st.data_editor(
-        pd.DataFrame(list(dim.synonyms), columns=["Synonyms"]),
-        num_rows="dynamic",
+    synonyms_df = values_data_editor(
+        dim.synonyms,
+        "Synonyms",
         key=f"{table.name}-add-dim-synonyms",
     )
-    for _, row in synonyms_df.iterrows():
-        if row["Synonyms"]:
-            dim.synonyms.append(row["Synonyms"])
+    dim.synonyms.extend(data_editor_values(synonyms_df, "Synonyms"))
 
     dim.data_type = st.text_input("Data type", key=f"{table.name}-add-dim-datatype")
     dim.unique = st.checkbox(
         "Does it have unique values?", key=f"{table.name}-add-dim-unique"
     )
-    sample_values_df = st.data_editor(
-        pd.DataFrame(list(dim.sample_values), columns=["Sample Values"]),
-        num_rows="dynamic",
+    sample_values_df = values_data_editor(
+        dim.sample_values,
+        "Sample Values",
         key=f"{table.name}-add-dim-sample-values",
     )
-    del dim.sample_values[:]
-    for _, row in sample_values_df.iterrows():
-        if row["Sample Values"]:
-            dim.sample_values.append(row["Sample Values"])
+    dim.sample_values.extend(data_editor_values(sample_values_df, "Sample Values"))
 
     if st.button("Add"):
         table.dimensions.append(dim)
@@ -293,36 +360,23 @@ def edit_measure(table_name: str, measure: semantic_model_pb2.Measure) -> None:
     measure.description = st.text_area(
         "Description", measure.description, key=f"{key_prefix}-edit-measure-description"
     )
-    synonyms_df = st.data_editor(
-        pd.DataFrame(list(measure.synonyms), columns=["Synonyms"]),
-        num_rows="dynamic",
+    synonyms_df = values_data_editor(
+        measure.synonyms,
+        "Synonyms",
         key=f"{key_prefix}-edit-measure-synonyms",
     )
-    del measure.synonyms[:]
-    for _, row in synonyms_df.iterrows():
-        if row["Synonyms"]:
-            measure.synonyms.append(row["Synonyms"])
+    replace_repeated_values(
+        measure.synonyms, data_editor_values(synonyms_df, "Synonyms")
+    )
 
     measure.data_type = st.text_input(
         "Data type", measure.data_type, key=f"{key_prefix}-edit-measure-data-type"
     )
 
-    aggr_options = semantic_model_pb2.AggregationType.keys()
-    # Replace the 'aggregation_type_unknown' string with an empty string for a better display of options.
-    aggr_options[0] = ""
-    default_aggregation_idx = next(
-        (
-            i
-            for i, s in enumerate(semantic_model_pb2.AggregationType.values())
-            if s == measure.default_aggregation
-        ),
-        0,
-    )
-
     default_aggregation = st.selectbox(
         "Default Aggregation",
-        aggr_options,
-        index=default_aggregation_idx,
+        _AGGR_OPTIONS,
+        index=_AGGR_VALUE_TO_IDX.get(measure.default_aggregation, 0),
         key=f"{key_prefix}-edit-measure-default-aggregation",
     )
     if default_aggregation:
@@ -337,15 +391,14 @@ def edit_measure(table_name: str, measure: semantic_model_pb2.Measure) -> None:
             semantic_model_pb2.AggregationType.aggregation_type_unknown
         )
 
-    sample_values_df = st.data_editor(
-        pd.DataFrame(list(measure.sample_values), columns=["Sample Values"]),
-        num_rows="dynamic",
+    sample_values_df = values_data_editor(
+        measure.sample_values,
+        "Sample Values",
         key=f"{key_prefix}-edit-measure-sample-values",
     )
-    del measure.sample_values[:]
-    for _, row in sample_values_df.iterrows():
-        if row["Sample Values"]:
-            measure.sample_values.append(row["Sample Values"])
+    replace_repeated_values(
+        measure.sample_values, data_editor_values(sample_values_df, "Sample Values")
+    )
 
     if st.button("Save"):
         st.rerun()
@@ -365,25 +418,19 @@ def add_measure(table: semantic_model_pb2.Table) -> None:
         measure.description = st.text_area(
             "Description", key=f"{table.name}-add-measure-description"
         )
-        synonyms_df = st.data_editor(
-            pd.DataFrame(list(measure.synonyms), columns=["Synonyms"]),
-            num_rows="dynamic",
+        synonyms_df = values_data_editor(
+            measure.synonyms,
+            "Synonyms",
             key=f"{table.name}-add-measure-synonyms",
         )
-        del measure.synonyms[:]
-        for _, row in synonyms_df.iterrows():
-            if row["Synonyms"]:
-                measure.synonyms.append(row["Synonyms"])
+        measure.synonyms.extend(data_editor_values(synonyms_df, "Synonyms"))
 
         measure.data_type = st.text_input(
             "Data type", key=f"{table.name}-add-measure-data-type"
         )
-        aggr_options = semantic_model_pb2.AggregationType.keys()
-        # Replace the 'aggregation_type_unknown' string with an empty string for a better display of options.
-        aggr_options[0] = ""
         default_aggregation = st.selectbox(
             "Default Aggregation",
-            aggr_options,
+            _AGGR_OPTIONS,
             key=f"{table.name}-edit-measure-default-aggregation",
         )
         if default_aggregation:
@@ -394,15 +441,14 @@ def add_measure(table: semantic_model_pb2.Table) -> None:
             except ValueError as e:
                 st.error(f"Invalid default_aggregation: {e}")
 
-        sample_values_df = st.data_editor(
-            pd.DataFrame(list(measure.sample_values), columns=["Sample Values"]),
-            num_rows="dynamic",
+        sample_values_df = values_data_editor(
+            measure.sample_values,
+            "Sample Values",
             key=f"{table.name}-add-measure-sample-values",
         )
-        del measure.sample_values[:]
-        for _, row in sample_values_df.iterrows():
-            if row["Sample Values"]:
-                measure.sample_values.append(row["Sample Values"])
+        measure.sample_values.extend(
+            data_editor_values(sample_values_df, "Sample Values")
+        )
 
         add_button = st.form_submit_button("Add")
 
@@ -428,29 +474,25 @@ def edit_time_dimension(
         tdim.description,
         key=f"{key_prefix}-edit-tdim-description",
     )
-    synonyms_df = st.data_editor(
-        pd.DataFrame(list(tdim.synonyms), columns=["Synonyms"]),
-        num_rows="dynamic",
+    synonyms_df = values_data_editor(
+        tdim.synonyms,
+        "Synonyms",
         key=f"{key_prefix}-tdim-edit-measure-synonyms",
     )
-    del tdim.synonyms[:]
-    for _, row in synonyms_df.iterrows():
-        if row["Synonyms"]:
-            tdim.synonyms.append(row["Synonyms"])
+    replace_repeated_values(tdim.synonyms, data_editor_values(synonyms_df, "Synonyms"))
 
     tdim.data_type = st.text_input(
         "Data type", tdim.data_type, key=f"{key_prefix}-edit-tdim-datatype"
     )
     tdim.unique = st.checkbox("Does it have unique values?", value=tdim.unique)
-    sample_values_df = st.data_editor(
-        pd.DataFrame(list(tdim.sample_values), columns=["Sample Values"]),
-        num_rows="dynamic",
+    sample_values_df = values_data_editor(
+        tdim.sample_values,
+        "Sample Values",
         key=f"{key_prefix}-edit-tdim-sample-values",
     )
-    del tdim.sample_values[:]
-    for _, row in sample_values_df.iterrows():
-        if row["Sample Values"]:
-            tdim.sample_values.append(row["Sample Values"])
+    replace_repeated_values(
+        tdim.sample_values, data_editor_values(sample_values_df, "Sample Values")
+    )
 
     if st.button("Save"):
         st.rerun()
@@ -467,30 +509,24 @@ def add_time_dimension(table: semantic_model_pb2.Table) -> None:
     tdim.description = st.text_area(
         "Description", key=f"{table.name}-add-tdim-description"
     )
-    synonyms_df = st.data_editor(
-        pd.DataFrame(list(tdim.synonyms), columns=["Synonyms"]),
-        num_rows="dynamic",
+    synonyms_df = values_data_editor(
+        tdim.synonyms,
+        "Synonyms",
         key=f"{table.name}-add-tdim-synonyms",
     )
-    del tdim.synonyms[:]
-    for _, row in synonyms_df.iterrows():
-        if row["Synonyms"]:
-            tdim.synonyms.append(row["Synonyms"])
+    tdim.synonyms.extend(data_editor_values(synonyms_df, "Synonyms"))
 
     # TODO(nsehrawat): Change the set of allowed data types here.
     tdim.data_type = st.text_input("Data type", key=f"{table.name}-add-tdim-data-types")
     tdim.unique = st.checkbox(
         "Does it have unique values?", key=f"{table.name}-add-tdim-unique"
     )
-    sample_values_df = st.data_editor(
-        pd.DataFrame(list(tdim.sample_values), columns=["Sample Values"]),
-        num_rows="dynamic",
+    sample_values_df = values_data_editor(
+        tdim.sample_values,
+        "Sample Values",
         key=f"{table.name}-add-tdim-sample-values",
     )
-    del tdim.sample_values[:]
-    for _, row in sample_values_df.iterrows():
-        if row["Sample Values"]:
-            tdim.sample_values.append(row["Sample Values"])
+    tdim.sample_values.extend(data_editor_values(sample_values_df, "Sample Values"))
 
     if st.button("Add", key=f"{table.name}-add-tdim-add"):
         table.time_dimensions.append(tdim)
@@ -501,7 +537,7 @@ def delete_dimension(table: semantic_model_pb2.Table, idx: int) -> None:
     """
     Inline deletes the dimension at a particular index in a Table protobuf.
     """
-    if len(table.dimensions) < idx:
+    if not 0 <= idx < len(table.dimensions):
         return
     del table.dimensions[idx]
 
@@ -510,7 +546,7 @@ def delete_measure(table: semantic_model_pb2.Table, idx: int) -> None:
     """
     Inline deletes the measure at a particular index in a Table protobuf.
     """
-    if len(table.measures) < idx:
+    if not 0 <= idx < len(table.measures):
         return
     del table.measures[idx]
 
@@ -519,136 +555,140 @@ def delete_time_dimension(table: semantic_model_pb2.Table, idx: int) -> None:
     """
     Inline deletes the time dimension at a particular index in a Table protobuf.
     """
-    if len(table.time_dimensions) < idx:
+    if not 0 <= idx < len(table.time_dimensions):
         return
     del table.time_dimensions[idx]
 
 
-def display_table(table_name: str) -> None:
+def display_table(table: semantic_model_pb2.Table) -> None:
     """
     Display all the data related to a logical table.
     """
-    for t in st.session_state.semantic_model.tables:
-        if t.name == table_name:
-            table: semantic_model_pb2.Table = t
-            break
+    table_name = table.name
 
     st.write("#### Table metadata")
-    table.name = st.text_input("Table Name", table.name)
+    set_if_changed(table, "name", st.text_input("Table Name", table.name))
     fqn_columns = st.columns(3)
     with fqn_columns[0]:
-        table.base_table.database = st.text_input(
-            "Physical Database",
-            table.base_table.database,
-            key=f"{table_name}-base_database",
+        set_if_changed(
+            table.base_table,
+            "database",
+            st.text_input(
+                "Physical Database",
+                table.base_table.database,
+                key=f"{table_name}-base_database",
+            ),
         )
     with fqn_columns[1]:
-        table.base_table.schema = st.text_input(
-            "Physical Schema",
-            table.base_table.schema,
-            key=f"{table_name}-base_schema",
+        set_if_changed(
+            table.base_table,
+            "schema",
+            st.text_input(
+                "Physical Schema",
+                table.base_table.schema,
+                key=f"{table_name}-base_schema",
+            ),
         )
     with fqn_columns[2]:
-        table.base_table.table = st.text_input(
-            "Physical Table", table.base_table.table, key=f"{table_name}-base_table"
+        set_if_changed(
+            table.base_table,
+            "table",
+            st.text_input(
+                "Physical Table",
+                table.base_table.table,
+                key=f"{table_name}-base_table",
+            ),
         )
 
-    table.description = st.text_area(
-        "Description", table.description, key=f"{table_name}-description"
+    set_if_changed(
+        table,
+        "description",
+        st.text_area("Description", table.description, key=f"{table_name}-description"),
     )
 
-    synonyms_df = st.data_editor(
-        pd.DataFrame(list(table.synonyms), columns=["Synonyms"]),
-        num_rows="dynamic",
+    synonyms_df = values_data_editor(
+        table.synonyms,
+        "Synonyms",
         key=f"{table_name}-synonyms",
         use_container_width=True,
     )
-    del table.synonyms[:]
-    for idx, row in synonyms_df.iterrows():
-        if row["Synonyms"]:
-            table.synonyms.append(row["Synonyms"])
+    replace_repeated_values(table.synonyms, data_editor_values(synonyms_df, "Synonyms"))
 
     st.write("#### Dimensions")
     header = ["Name", "Expression", "Data Type"]
-    header_cols = st.columns(len(header) + 1)
+    header_cols = st.columns(_FIELD_ROW_COLUMN_SPEC)
     for i, h in enumerate(header):
         header_cols[i].write(f"###### {h}")
 
     for idx, dim in enumerate(table.dimensions):
-        cols = st.columns(len(header) + 1)
+        cols = st.columns(_FIELD_ROW_COLUMN_SPEC)
         cols[0].write(dim.name)
         cols[1].write(dim.expr)
         cols[2].write(dim.data_type)
-        with cols[-1]:
-            subcols = st.columns(2)
-            if subcols[0].button(
-                "Edit",
-                key=f"{table_name}-edit-dimension-{idx}",
-            ):
-                edit_dimension(table_name, dim)
-            subcols[1].button(
-                "Delete",
-                key=f"{table_name}-delete-dimension-{idx}",
-                on_click=delete_dimension,
-                args=(
-                    table,
-                    idx,
-                ),
-            )
+        if cols[3].button(
+            "Edit",
+            key=f"{table_name}-edit-dimension-{idx}",
+        ):
+            edit_dimension(table_name, dim)
+        cols[4].button(
+            "Delete",
+            key=f"{table_name}-delete-dimension-{idx}",
+            on_click=delete_dimension,
+            args=(
+                table,
+                idx,
+            ),
+        )
 
     if st.button("Add Dimension", key=f"{table_name}-add-dimension"):
         add_dimension(table)
 
     st.write("#### Measures")
-    header_cols = st.columns(len(header) + 1)
+    header_cols = st.columns(_FIELD_ROW_COLUMN_SPEC)
     for i, h in enumerate(header):
         header_cols[i].write(f"###### {h}")
 
     for idx, measure in enumerate(table.measures):
-        cols = st.columns(len(header) + 1)
+        cols = st.columns(_FIELD_ROW_COLUMN_SPEC)
         cols[0].write(measure.name)
         cols[1].write(measure.expr)
         cols[2].write(measure.data_type)
-        with cols[-1]:
-            subcols = st.columns(2)
-            if subcols[0].button("Edit", key=f"{table_name}-edit-measure-{idx}"):
-                edit_measure(table_name, measure)
-            subcols[1].button(
-                "Delete",
-                key=f"{table_name}-delete-measure-{idx}",
-                on_click=delete_measure,
-                args=(
-                    table,
-                    idx,
-                ),
-            )
+        if cols[3].button("Edit", key=f"{table_name}-edit-measure-{idx}"):
+            edit_measure(table_name, measure)
+        cols[4].button(
+            "Delete",
+            key=f"{table_name}-delete-measure-{idx}",
+            on_click=delete_measure,
+            args=(
+                table,
+                idx,
+            ),
+        )
 
     if st.button("Add Measure", key=f"{table_name}-add-measure"):
         add_measure(table)
 
     st.write("#### Time Dimensions")
-    header_cols = st.columns(len(header) + 1)
+    header_cols = st.columns(_FIELD_ROW_COLUMN_SPEC)
     for i, h in enumerate(header):
         header_cols[i].write(f"###### {h}")
 
     for idx, tdim in enumerate(table.time_dimensions):
-        cols = st.columns(len(header) + 1)
+        cols = st.columns(_FIELD_ROW_COLUMN_SPEC)
         cols[0].write(tdim.name)
         cols[1].write(tdim.expr)
         cols[2].write(tdim.data_type)
-        with cols[-1]:
-            subcols = st.columns(2)
-            if subcols[0].button("Edit", key=f"{table_name}-edit-tdim-{idx}"):
-                edit_time_dimension(table_name, tdim)
-            subcols[1].button(
-                "Delete",
-                key=f"{table_name}-delete-tdim-{idx}",
-                on_click=delete_time_dimension,
-                args=(
-                    table,
-                    idx,
-                ),
-            )
+        if cols[3].button("Edit", key=f"{table_name}-edit-tdim-{idx}"):
+            edit_time_dimension(table_name, tdim)
+        cols[4].button(
+            "Delete",
+            key=f"{table_name}-delete-tdim-{idx}",
+            on_click=delete_time_dimension,
+            args=(
+                table,
+                idx,
+            ),
+        )
 
     if st.button("Add Time Dimension", key=f"{table_name}-add-tdim"):
         add_time_dimension(table)
@@ -659,11 +699,13 @@ def add_new_table() -> None:
     """
     Renders a dialog box to add a new logical table.
     """
+    from semantic_model_generator.generate_model import raw_schema_to_semantic_context
+
+    existing_table_names = {t.name for t in st.session_state.semantic_model.tables}
     table = Table()
     table.name = st.text_input("Table Name")
-    for t in st.session_state.semantic_model.tables:
-        if t.name == table.name:
-            st.error(f"Table called '{table.name}' already exists")
+    if table.name in existing_table_names:
+        st.error(f"Table called '{table.name}' already exists")
 
     table.base_table.database = st.text_input("Physical Database")
     table.base_table.schema = st.text_input("Physical Schema")
@@ -675,9 +717,7 @@ def add_new_table() -> None:
         use_container_width=True,
         hide_index=True,
     )
-    for _, row in synonyms_df.iterrows():
-        if row["Synonyms"]:
-            table.synonyms.append(row["Synonyms"])
+    table.synonyms.extend(data_editor_values(synonyms_df, "Synonyms"))
     table.description = st.text_area("Description", key="add-new-table-description")
     if st.button("Add"):
         with st.spinner(text="Fetching table details from database ..."):
@@ -696,10 +736,9 @@ def add_new_table() -> None:
             table.dimensions.extend(semantic_model.tables[0].dimensions)
             table.measures.extend(semantic_model.tables[0].measures)
             table.time_dimensions.extend(semantic_model.tables[0].time_dimensions)
-            for t in st.session_state.semantic_model.tables:
-                if t.name == table.name:
-                    st.error(f"Table called '{table.name}' already exists")
-                    return
+            if table.name in existing_table_names:
+                st.error(f"Table called '{table.name}' already exists")
+                return
         st.session_state.semantic_model.tables.append(table)
         st.rerun()
 
@@ -737,11 +776,32 @@ def edit_semantic_model() -> None:
     st.write("#### Tables")
     for t in st.session_state.semantic_model.tables:
         with st.expander(t.name):
-            display_table(t.name)
+            display_table(t)
     if st.button("Add Table"):
         add_new_table()
 
 
+@st.cache_data(show_spinner=False, max_entries=4)
+def _parse_semantic_model_yaml(yaml_str: str) -> bytes:
+    """
+    Parses the YAML into a serialized SemanticModel. st.cache_data pickles return values, and the generated
+    protobuf messages can't be pickled, so the serialized bytes are cached instead of the message itself.
+    """
+    return yaml_to_semantic_model(yaml_str).SerializeToString()
+
+
+def parse_semantic_model_yaml(yaml_str: str) -> semantic_model_pb2.SemanticModel:
+    """
+    Simple wrapper around yaml_to_semantic_model to cache the results, so that reruns after an import
+    do not re-parse the same YAML.
+
+    Returns: SemanticModel protobuf
+    """
+    return semantic_model_pb2.SemanticModel.FromString(
+        _parse_semantic_model_yaml(yaml_str)
+    )
+
+
 def import_yaml() -> None:
     """
     Renders a page to import an existing yaml file.
@@ -755,8 +815,8 @@ def import_yaml() -> None:
 
     if uploaded_file is not None:
         try:
-            yaml_str = StringIO(uploaded_file.getvalue().decode("utf-8")).read()
-            pb = yaml_to_semantic_model(yaml_str)
+            yaml_str = uploaded_file.getvalue().decode("utf-8")
+            pb = parse_semantic_model_yaml(yaml_str)
         except Exception as ex:
             st.error(f"Failed to import: {ex}")
             return
@@ -772,9 +832,30 @@ def import_yaml() -> None:
             st.rerun()
 
 
+@lru_cache(maxsize=4)
+def _yaml_for(serialized_model: bytes) -> str:
+    """
+    Converts a serialized SemanticModel into its YAML representation.
+    Keyed on the serialized bytes so that repeated reruns against an unchanged model skip the
+    (comparatively slow) reflection-based proto -> YAML conversion.
+    """
+    semantic_model = semantic_model_pb2.SemanticModel()
+    semantic_model.ParseFromString(serialized_model)
+    return proto_to_yaml(semantic_model)
+
+
+def semantic_model_to_yaml() -> str:
+    """
+    Returns the YAML representation of the semantic model stored in the session state.
+    """
+    return _yaml_for(
+        st.session_state.semantic_model.SerializeToString(deterministic=True)
+    )
+
+
 @st.dialog("Model YAML", width="large")  # type: ignore
 def show_yaml_in_dialog() -> None:
-    yaml = proto_to_yaml(st.session_state.semantic_model)
+    yaml = semantic_model_to_yaml()
     st.code(
         yaml,
         language="yaml",
@@ -782,31 +863,38 @@ def show_yaml_in_dialog() -> None:
     )
 
 
-def upload_yaml(file_name: str, conn: SnowflakeConnection) -> None:
-    """util to upload the semantic model."""
-    import os
-    import tempfile
-
-    yaml = proto_to_yaml(st.session_state.semantic_model)
-
-    with tempfile.TemporaryDirectory() as temp_dir:
-        tmp_file_path = os.path.join(temp_dir, f"{file_name}.yaml")
-
-        with open(tmp_file_path, "w") as temp_file:
-            temp_file.write(yaml)
+def get_tmp_file_name() -> str:
+    """
+    Returns the name of the temp semantic model file for the current session.
+    Generated once per session so that concurrent users of the app never share (and clobber) a temp file.
+    """
+    tmp_file_name: str = st.session_state.setdefault(
+        "tmp_file_name", f"admin_app_temp_model_{uuid.uuid4().hex}"
+    )
+    return tmp_file_name
 
-        set_database(conn, st.session_state.snowflake_stage.stage_database)
-        set_schema(conn, st.session_state.snowflake_stage.stage_schema)
-        upload_sql = f"PUT file://{tmp_file_path} @{st.session_state.snowflake_stage.stage_name} AUTO_COMPRESS=FALSE OVERWRITE=TRUE"
-        conn.cursor().execute(upload_sql)
 
-        if file_name != _TMP_FILE_NAME:
-            # If the user did official uploading, delete the saved temp file from stage.
-            try:
-                delete_tmp_sql = f"REMOVE @{st.session_state.snowflake_stage.stage_name}/{_TMP_FILE_NAME}.yaml"
-                conn.cursor().execute(delete_tmp_sql)
-            except Exception:
-                pass
+def upload_yaml(file_name: str, conn: SnowflakeConnection) -> None:
+    """util to upload the semantic model."""
+    yaml = semantic_model_to_yaml()
+
+    set_database(conn, st.session_state.snowflake_stage.stage_database)
+    set_schema(conn, st.session_state.snowflake_stage.stage_schema)
+    # The YAML is streamed from memory; the local path in the PUT only determines the staged file name.
+    upload_sql = f"PUT file://{file_name}.yaml @{st.session_state.snowflake_stage.stage_name} AUTO_COMPRESS=FALSE OVERWRITE=TRUE"
+    # Reuse a single cursor on the app-wide cached connection for both the upload and the cleanup below.
+    cursor = conn.cursor()
+    cursor.execute(upload_sql, file_stream=BytesIO(yaml.encode("utf-8")))
+
+    tmp_file_name = get_tmp_file_name()
+    if file_name != tmp_file_name:
+        # If the user did official uploading, delete the saved temp file from stage.
+        # The cleanup is best-effort, so submit it asynchronously rather than waiting on it to finish.
+        try:
+            delete_tmp_sql = f"REMOVE @{st.session_state.snowflake_stage.stage_name}/{tmp_file_name}.yaml"
+            cursor.execute_async(delete_tmp_sql)
+        except Exception:
+            pass
 
 
 def validate_and_upload_tmp_yaml(conn: SnowflakeConnection) -> None:
@@ -816,11 +904,11 @@ def validate_and_upload_tmp_yaml(conn: SnowflakeConnection) -> None:
     """
     from semantic_model_generator.validate_model import validate
 
-    yaml_str = proto_to_yaml(st.session_state.semantic_model)
+    yaml_str = semantic_model_to_yaml()
     try:
         # whenever valid, upload to temp stage path.
         validate(yaml_str, SNOWFLAKE_ACCOUNT, conn)
-        # upload_yaml(_TMP_FILE_NAME)
+        # upload_yaml(get_tmp_file_name())
         st.session_state.validated = True
         update_last_validated_model()
     except Exception as e:
@@ -1045,6 +1133,9 @@ def run_generate_model_str_from_snowflake(
 
     Returns: None
     """
+    from semantic_model_generator.generate_model import (
+        generate_model_str_from_snowflake,
+    )
 
     if not model_name:
         st.error("Please provide a name for your semantic model.")
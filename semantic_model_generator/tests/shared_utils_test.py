@@ -0,0 +1,53 @@
+from typing import Generator
+
+import pytest
+
+from admin_apps.shared_utils import (
+    _parse_semantic_model_yaml,
+    parse_semantic_model_yaml,
+)
+
+_VALID_YAML = """
+name: jaffle_shop
+tables:
+  - name: orders
+    description: Order overview data mart.
+    base_table:
+      database: autosql_dataset_dbt_jaffle_shop
+      schema: data
+      table: orders
+    dimensions:
+      - name: order_id
+        expr: order_id
+        data_type: NUMBER
+        synonyms:
+          - "order number"
+"""
+
+
+@pytest.fixture(autouse=True)
+def clear_parse_cache() -> Generator[None, None, None]:
+    _parse_semantic_model_yaml.clear()
+    yield
+    _parse_semantic_model_yaml.clear()
+
+
+def test_parse_semantic_model_yaml() -> None:
+    semantic_model = parse_semantic_model_yaml(_VALID_YAML)
+
+    assert semantic_model.name == "jaffle_shop"
+    assert semantic_model.tables[0].name == "orders"
+    assert list(semantic_model.tables[0].dimensions[0].synonyms) == ["order number"]
+
+
+def test_parse_semantic_model_yaml_cache_hit() -> None:
+    first = parse_semantic_model_yaml(_VALID_YAML)
+    # Edits to a returned model must not leak into the cached result.
+    first.name = "edited"
+    first.tables[0].dimensions[0].synonyms.append("another synonym")
+
+    second = parse_semantic_model_yaml(_VALID_YAML)
+
+    assert second is not first
+    assert second.name == "jaffle_shop"
+    assert list(second.tables[0].dimensions[0].synonyms) == ["order number"]